@@ -96,12 +96,12 @@ impl MultiProviderLlm {
         self.call_ollama_vision(prompt, image_b64).await
     }
 
-    /// Audio transcription — use local Whisper (not yet wired) or Faster-Whisper CLI.
+    /// Audio transcription — handled by `TranscriptionEngine` (whisper.cpp or Faster-Whisper CLI).
     pub async fn audio_transcription(
         &self,
         _audio_path: &std::path::Path,
     ) -> Result<String, String> {
-        Err("Use local Whisper/Faster-Whisper for transcription (set WHISPER_BIN env var)".into())
+        Err("Use TranscriptionEngine for transcription (set WHISPER_BIN for Faster-Whisper)".into())
     }
 
     pub fn token_status(&self) -> String {
@@ -341,7 +341,7 @@ pub async fn smart_edit(
                 }
             };
 
-        match TranscriptionEngine::new(None).await {
+        match TranscriptionEngine::shared().await {
             Err(e) => {
                 warn!("[SMART] Transcription engine init failed: {}", e);
                 None
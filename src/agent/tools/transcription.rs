@@ -6,10 +6,17 @@ use crate::gpu_backend::get_gpu_context;
 use anyhow::{Context, Result};
 use hf_hub::api::sync::Api;
 use serde::{Deserialize, Serialize};
+use std::collections::HashMap;
 use std::fs;
 use std::path::{Path, PathBuf};
-use tracing::info;
-use whisper_rs::{FullParams, SamplingStrategy, WhisperContext, WhisperContextParameters};
+use std::sync::{Arc, Mutex, OnceLock};
+use std::time::{Duration, Instant};
+use tokio::sync::mpsc::UnboundedSender;
+use tracing::{info, warn};
+use whisper_rs::{
+    FullParams, SamplingStrategy, SegmentCallbackData, WhisperContext, WhisperContextParameters,
+    WhisperState,
+};
 
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct TranscriptSegment {
@@ -20,6 +27,16 @@ pub struct TranscriptSegment {
     pub words: Vec<WordTimestamp>,
 }
 
+/// An update on the live channel of `TranscriptionEngine::transcribe_streaming`.
+#[derive(Debug, Clone)]
+pub enum LiveEvent {
+    /// A segment, sent as soon as it is decoded.
+    Segment(TranscriptSegment),
+    /// The backend failed part way and the fallback starts over from 0 s:
+    /// discard every segment received so far.
+    Restart,
+}
+
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct WordTimestamp {
     pub word: String,
@@ -27,8 +44,139 @@ pub struct WordTimestamp {
     pub end: f64,
 }
 
+/// Loaded Whisper models keyed by (model path, GPU mode), shared process-wide.
+///
+/// Each key gets its own slot so a multi-second weight load only blocks
+/// callers waiting for that same model; the map lock is held just long enough
+/// to find or insert the slot.
+static WHISPER_MODELS: OnceLock<Mutex<HashMap<(PathBuf, bool), ModelSlot>>> = OnceLock::new();
+
+/// A model that is loaded, or empty until its first successful load.
+type ModelSlot = Arc<Mutex<Option<Arc<LoadedWhisper>>>>;
+
+/// How long a loaded model may sit unused before its memory is released
+/// (`SYNOID_WHISPER_IDLE_TTL` seconds, default 300; 0 keeps models forever).
+fn model_idle_ttl() -> Option<Duration> {
+    let secs = std::env::var("SYNOID_WHISPER_IDLE_TTL")
+        .ok()
+        .and_then(|v| v.trim().parse::<u64>().ok())
+        .unwrap_or(300);
+    (secs > 0).then(|| Duration::from_secs(secs))
+}
+
+/// Start (once) a background thread that drops models idle for longer than
+/// the TTL, so a warm model doesn't pin gigabytes of RAM/VRAM forever.
+/// Models held by an in-flight job are never evicted.
+fn spawn_idle_reaper() {
+    static STARTED: OnceLock<()> = OnceLock::new();
+    let Some(ttl) = model_idle_ttl() else {
+        return;
+    };
+    STARTED.get_or_init(|| {
+        let spawned = std::thread::Builder::new()
+            .name("whisper-idle-reaper".into())
+            .spawn(move || loop {
+                std::thread::sleep((ttl / 4).max(Duration::from_secs(5)));
+                let Some(models) = WHISPER_MODELS.get() else {
+                    continue;
+                };
+                let mut models = models.lock().unwrap_or_else(|e| e.into_inner());
+                models.retain(|(path, _), slot| {
+                    // Someone is loading this model or about to use it.
+                    if Arc::strong_count(slot) > 1 {
+                        return true;
+                    }
+                    let slot = slot.lock().unwrap_or_else(|e| e.into_inner());
+                    let Some(model) = slot.as_ref() else {
+                        return false;
+                    };
+                    let idle = model
+                        .last_used
+                        .lock()
+                        .unwrap_or_else(|e| e.into_inner())
+                        .elapsed();
+                    let keep = Arc::strong_count(model) > 1 || idle < ttl;
+                    if !keep {
+                        info!(
+                            "[SOVEREIGN] 💤 Releasing Whisper model idle for {}s: {:?}",
+                            idle.as_secs(),
+                            path
+                        );
+                    }
+                    keep
+                });
+            });
+        if let Err(e) = spawned {
+            warn!("[SOVEREIGN] Could not start Whisper idle reaper: {}", e);
+        }
+    });
+}
+
+/// A loaded Whisper model and its resident decoding state.
+struct LoadedWhisper {
+    ctx: WhisperContext,
+    /// Decoder state (KV caches, mel and compute buffers) parked between jobs so
+    /// its device allocations stay resident instead of being rebuilt per call.
+    idle_state: Mutex<Option<WhisperState>>,
+    /// When the model last finished a job; drives idle eviction.
+    last_used: Mutex<Instant>,
+}
+
+impl LoadedWhisper {
+    /// Take the resident state, or build a fresh one if another job holds it.
+    fn checkout_state(&self) -> Result<WhisperState> {
+        let parked = self
+            .idle_state
+            .lock()
+            .unwrap_or_else(|e| e.into_inner())
+            .take();
+        match parked {
+            Some(state) => Ok(state),
+            None => self.ctx.create_state().context("Create state"),
+        }
+    }
+
+    /// Run one second of silence through the model and park the warmed state.
+    ///
+    /// The first GPU decode pays one-off costs (CUDA module load, cuBLAS
+    /// handles, compute-buffer sizing); doing it at load time keeps them out
+    /// of the first real job's decode loop.
+    fn warm_up(&self) {
+        let warmed = self.checkout_state().and_then(|mut state| {
+            let mut params = FullParams::new(SamplingStrategy::Greedy { best_of: 1 });
+            params.set_n_threads(matmul_threads() as i32);
+            params.set_single_segment(true);
+            params.set_no_context(true);
+            params.set_print_special(false);
+            params.set_print_progress(false);
+            params.set_print_realtime(false);
+            params.set_print_timestamps(false);
+            state
+                .full(params, &[0.0f32; 16000])
+                .context("Warm-up decode")?;
+            Ok(state)
+        });
+        match warmed {
+            Ok(state) => self.checkin_state(state),
+            Err(e) => warn!("[SOVEREIGN] Whisper warm-up skipped: {}", e),
+        }
+    }
+
+    /// Park a finished state for the next job (at most one stays resident).
+    fn checkin_state(&self, state: WhisperState) {
+        *self.last_used.lock().unwrap_or_else(|e| e.into_inner()) = Instant::now();
+        let mut slot = self.idle_state.lock().unwrap_or_else(|e| e.into_inner());
+        if slot.is_none() {
+            *slot = Some(state);
+        }
+    }
+}
+
 pub struct TranscriptionEngine {
+    model_name: String,
     model_path: PathBuf,
+    /// 30 s windows per encoder pass for Faster-Whisper (None = 8 on CUDA, 1 on CPU).
+    batch_size: Option<usize>,
 }
 
 impl TranscriptionEngine {
@@ -36,24 +184,38 @@ impl TranscriptionEngine {
         let model_name = model_name.unwrap_or_else(|| "large-v3".to_string());
 
         // Locate or download the model in blocking task
-        let model_path =
-            tokio::task::spawn_blocking(move || Self::ensure_model(&model_name)).await??;
+        let name = model_name.clone();
+        let model_path = tokio::task::spawn_blocking(move || Self::ensure_model(&name)).await??;
+
+        Ok(Self {
+            model_name,
+            model_path,
+            batch_size: None,
+        })
+    }
 
-        Ok(Self { model_path })
+    /// The process-wide default engine, built on first use.
+    ///
+    /// The CLI, GUI, editor API and pipelines all transcribe through this one
+    /// instance, so they share one model resolution and one loaded model.
+    pub async fn shared() -> Result<Arc<Self>> {
+        static SHARED: tokio::sync::OnceCell<Arc<TranscriptionEngine>> =
+            tokio::sync::OnceCell::const_new();
+        SHARED
+            .get_or_try_init(|| async { Self::new(None).await.map(Arc::new) })
+            .await
+            .cloned()
+    }
+
+    /// Override how many 30 s windows Faster-Whisper stacks into one encoder pass.
+    pub fn with_batch_size(mut self, batch_size: usize) -> Self {
+        self.batch_size = Some(batch_size.max(1));
+        self
     }
 
     /// Ensure the GGML model is present (Sovereign Ear - ModelDownloader)
     fn ensure_model(model_name: &str) -> Result<PathBuf> {
-        // Use environment variable for cache dir if available
-        let base_dir = if let Ok(cache_env) = std::env::var("SYNOID_CACHE_DIR") {
-            PathBuf::from(cache_env).join("models")
-        } else {
-            dirs::cache_dir()
-                .unwrap_or_else(|| PathBuf::from("."))
-                .join("synoid")
-                .join("models")
-        };
-
+        let base_dir = cache_root().join("models");
         fs::create_dir_all(&base_dir)?;
 
         let filename = format!("ggml-{}.bin", model_name);
@@ -79,82 +241,81 @@ impl TranscriptionEngine {
     }
 
     pub async fn transcribe(&self, audio_path: &Path) -> Result<Vec<TranscriptSegment>> {
-        info!("[SOVEREIGN] Transcribing: {:?}", audio_path);
-
-        // 1. Try Cloud Transcription (Groq Whisper) for highest accuracy and speed
-        let agent = crate::agent::gpt_oss_bridge::SynoidAgent::new(
-            "http://localhost:11434",
-            "default",
-        );
+        Ok(self.transcribe_streaming(audio_path, None).await?.0)
+    }
 
-        if let Ok(json_str) = agent.transcribe_audio(audio_path).await {
-            info!("[TRANSCRIBE] AI Transcription Succeeded.");
-            let json_string: String = json_str;
-            if let Ok(val) = serde_json::from_str::<serde_json::Value>(&json_string) {
-                if let Some(segments_arr) = val.get("segments").and_then(|v| v.as_array()) {
-                    let mut segments = Vec::new();
-                    for seg in segments_arr {
-                        if let (Some(start), Some(end), Some(text)) = (
-                            seg.get("start").and_then(|v| v.as_f64()),
-                            seg.get("end").and_then(|v| v.as_f64()),
-                            seg.get("text").and_then(|v| v.as_str()),
-                        ) {
-                            // Extract word-level timestamps if available
-                            let mut words = Vec::new();
-                            if let Some(words_arr) = seg.get("words").and_then(|v| v.as_array()) {
-                                for word_obj in words_arr {
-                                    if let (Some(word), Some(w_start), Some(w_end)) = (
-                                        word_obj.get("word").and_then(|v| v.as_str()),
-                                        word_obj.get("start").and_then(|v| v.as_f64()),
-                                        word_obj.get("end").and_then(|v| v.as_f64()),
-                                    ) {
-                                        words.push(WordTimestamp {
-                                            word: word.to_string(),
-                                            start: w_start,
-                                            end: w_end,
-                                        });
-                                    }
-                                }
-                            }
-
-                            segments.push(TranscriptSegment {
-                                start,
-                                end,
-                                text: text.to_string(),
-                                words,
-                            });
-                        }
-                    }
+    /// Like `transcribe`, but also sends each segment on `live` as soon as it is
+    /// decoded so callers can show captions before the whole file is done. If
+    /// Faster-Whisper fails and whisper.cpp takes over, `LiveEvent::Restart` is
+    /// sent before its first segment.
+    ///
+    /// Live segments are raw decoder output (no word timestamps, no hallucination
+    /// filtering); the returned transcript is the authoritative one. The detected
+    /// language is returned alongside it when the backend reports one.
+    pub async fn transcribe_streaming(
+        &self,
+        audio_path: &Path,
+        live: Option<UnboundedSender<LiveEvent>>,
+    ) -> Result<(Vec<TranscriptSegment>, Option<String>)> {
+        info!("[SOVEREIGN] Transcribing: {:?}", audio_path);
 
-                    if !segments.is_empty() {
-                        let segments = filter_hallucinations(segments);
-                        let word_count: usize = segments.iter().map(|s| s.words.len()).sum();
-                        info!("[SOVEREIGN] ☁️ Cloud Transcription Complete: {} segments, {} word-level timestamps (via Groq Whisper). Subtitles enhanced.", segments.len(), word_count);
-                        return Ok(segments);
-                    }
-                }
-            }
+        // Fail fast before GPU probing, spawning a backend or loading a model.
+        if !audio_path.is_file() {
+            anyhow::bail!("Audio file not found: {:?}", audio_path);
         }
 
-        info!("[SOVEREIGN] ⚠️ Cloud transcription unavailable or failed. Falling back to local Sovereign Ear.");
-
         // Check for GPU availability
         let gpu = get_gpu_context().await;
         let use_gpu = gpu.has_gpu();
 
+        // 1. Try Faster-Whisper (CTranslate2, int8 weights) when WHISPER_BIN points at its CLI
+        if let Some(bin) = faster_whisper_bin() {
+            let device = if use_gpu { "cuda" } else { "cpu" };
+            let compute_type = ctranslate2_compute_type(use_gpu, gpu.compute_capability());
+            let batch_size = self.batch_size.unwrap_or(if use_gpu { 8 } else { 1 });
+            match Self::transcribe_faster_whisper(
+                bin,
+                &self.model_name,
+                audio_path,
+                device,
+                compute_type,
+                batch_size,
+                live.clone(),
+            )
+            .await
+            {
+                Ok((segments, language)) if !segments.is_empty() => {
+                    let segments = filter_hallucinations(segments);
+                    let word_count: usize = segments.iter().map(|s| s.words.len()).sum();
+                    info!(
+                        "[SOVEREIGN] ⚡ Faster-Whisper Transcription Complete: {} segments, {} word-level timestamps.",
+                        segments.len(),
+                        word_count
+                    );
+                    return Ok((segments, language));
+                }
+                Ok(_) => warn!("[SOVEREIGN] ⚠️ Faster-Whisper returned no segments."),
+                Err(e) => warn!("[SOVEREIGN] ⚠️ Faster-Whisper failed: {}", e),
+            }
+            info!("[SOVEREIGN] Falling back to local Sovereign Ear.");
+            if let Some(tx) = &live {
+                let _ = tx.send(LiveEvent::Restart);
+            }
+        }
+
         if use_gpu {
             info!("[SOVEREIGN] 🚀 GPU Acceleration ENABLED for Whisper");
         } else {
             info!("[SOVEREIGN] 🐌 Using CPU for transcription");
         }
 
-        // 1. Prepare Audio
+        // 2. Prepare Audio
         // Running CPU-heavy audio processing in blocking thread
         let audio_path_buf = audio_path.to_path_buf();
         let model_path = self.model_path.clone();
 
         let segments = tokio::task::spawn_blocking(move || {
-            Self::transcribe_blocking(&model_path, &audio_path_buf, use_gpu)
+            Self::transcribe_blocking(&model_path, &audio_path_buf, use_gpu, live)
         })
         .await??;
 
@@ -162,68 +323,172 @@ impl TranscriptionEngine {
             "[SOVEREIGN] Local Transcription Complete: {} segments.",
             segments.len()
         );
-        Ok(segments)
+        Ok((segments, None))
     }
 
-    fn transcribe_blocking(
-        model_path: &Path,
+    /// Run the Faster-Whisper CLI (e.g. `whisper-ctranslate2`) and parse its JSON output.
+    ///
+    /// CTranslate2 re-implements Whisper in C++ with int8 weights, which roughly
+    /// halves VRAM and gives a 2-4× lower real-time factor than the reference model.
+    async fn transcribe_faster_whisper(
+        bin: &Path,
+        model_name: &str,
         audio_path: &Path,
-        use_gpu: bool,
-    ) -> Result<Vec<TranscriptSegment>> {
-        // Read audio
-        let mut reader = hound::WavReader::open(audio_path).context("Open WAV")?;
-        let spec = reader.spec();
-
-        let mut pcm_data: Vec<f32>;
-
-        let is_16k_mono = spec.sample_rate == 16000 && spec.channels == 1;
+        device: &str,
+        compute_type: &str,
+        batch_size: usize,
+        live: Option<UnboundedSender<LiveEvent>>,
+    ) -> Result<(Vec<TranscriptSegment>, Option<String>)> {
+        use std::process::Stdio;
+        use tokio::io::{AsyncBufReadExt, AsyncReadExt, BufReader};
+        use tokio::process::Command;
 
-        if is_16k_mono {
-            info!("[SOVEREIGN] 🎧 Native 16kHz mono detected. Fast-path memory loading...");
-            // Pre-allocate for exactly the number of samples
-            pcm_data = Vec::with_capacity(reader.duration() as usize);
+        info!(
+            "[SOVEREIGN] ⚡ Faster-Whisper: model={} device={} compute_type={} batch={}",
+            model_name, device, compute_type, batch_size
+        );
 
-            // Read directly into f32 vec
-            for sample in reader.samples::<i16>() {
-                if let Ok(s) = sample {
-                    pcm_data.push((s as f32) / 32768.0);
-                }
-            }
-        } else {
-            info!("[SOVEREIGN] 🐌 Downmixingxerx/resampling in memory. (Channels: {}, Rate: {}). This uses significant RAM.", spec.channels, spec.sample_rate);
-
-            // Manual conversion and downmix to mono simultaneously
-            let channels = spec.channels as usize;
-            let mut f32_samples = Vec::with_capacity((reader.duration() as usize) / channels);
-            let mut sample_iter = reader.samples::<i16>();
-
-            while let Some(Ok(first_sample)) = sample_iter.next() {
-                let mut sum = first_sample as f32;
-                // Accumulate other channels
-                for _ in 1..channels {
-                    if let Some(Ok(s)) = sample_iter.next() {
-                        sum += s as f32;
-                    }
+        let out_dir = std::env::temp_dir().join(format!("synoid_fw_{}", uuid_simple()));
+        fs::create_dir_all(&out_dir)?;
+
+        let mut cmd = Command::new(bin);
+        cmd.stealth().arg(audio_path);
+        // Point at our locally converted copy once it exists: it is quantized
+        // to exactly `compute_type`, whereas the CLI's own download from the
+        // Hugging Face cache is re-quantized at load time if the types differ.
+        match ct2_model_dir(model_name, compute_type) {
+            Some(dir) => cmd.arg("--model_directory").arg(dir),
+            None => cmd.args(["--model", model_name]),
+        };
+        cmd.args(["--device", device])
+            .args(["--compute_type", compute_type])
+            .arg("--threads")
+            .arg(matmul_threads().to_string())
+            .args(["--beam_size", "5"])
+            .args(["--vad_filter", "True"])
+            .arg("--vad_min_silence_duration_ms")
+            .arg(VAD_MIN_SILENCE_MS.to_string())
+            .args(["--condition_on_previous_text", "False"])
+            .args(["--temperature", "0"])
+            .args(["--temperature_increment_on_fallback", "None"])
+            .args(["--word_timestamps", "True"])
+            .args(["--output_format", "json"])
+            .args(["--verbose", if live.is_some() { "True" } else { "False" }])
+            .arg("--output_dir")
+            .arg(&out_dir)
+            // Python block-buffers stdout on a pipe, which would hold verbose
+            // segments back in bursts; and on Windows it writes in the locale
+            // encoding, which `next_line` rejects for non-ASCII transcripts.
+            .env("PYTHONUNBUFFERED", "1")
+            .env("PYTHONIOENCODING", "utf-8");
+
+        // Pool CUDA allocations in the child so per-step KV/activation buffers are
+        // recycled instead of going through cudaMalloc/cudaFree. Only the child's
+        // environment is touched, and values the user already set win.
+        if device == "cuda" {
+            for (key, value) in CUDA_ALLOCATOR_ENV {
+                if std::env::var_os(key).is_none() {
+                    cmd.env(key, value);
                 }
-                f32_samples.push((sum / channels as f32) / 32768.0);
             }
+        }
 
-            // Resample if needed (Naive linear)
-            if spec.sample_rate != 16000 {
-                let ratio = 16000.0 / spec.sample_rate as f32;
-                let new_len = (f32_samples.len() as f32 * ratio) as usize;
-                pcm_data = Vec::with_capacity(new_len);
-                for i in 0..new_len {
-                    let src_idx = (i as f32 / ratio) as usize;
-                    if src_idx < f32_samples.len() {
-                        pcm_data.push(f32_samples[src_idx]);
+        // Batched pipeline: stack N 30 s windows into one encoder forward pass so
+        // the same weight traffic serves N windows.
+        if batch_size > 1 {
+            cmd.args(["--batched", "True"])
+                .arg("--batch_size")
+                .arg(batch_size.to_string());
+        }
+
+        let mut child = cmd
+            .stdout(Stdio::piped())
+            .stderr(Stdio::piped())
+            .spawn()
+            .context("Launching Faster-Whisper")?;
+
+        // Drain stderr in the background so a chatty CLI can't block on a full pipe.
+        let mut stderr = child.stderr.take().context("Faster-Whisper stderr")?;
+        let stderr_task = tokio::spawn(async move {
+            let mut buf = String::new();
+            let _ = stderr.read_to_string(&mut buf).await;
+            buf
+        });
+
+        // Verbose mode (only enabled for live callers) prints each segment as it is decoded.
+        let stdout = child.stdout.take().context("Faster-Whisper stdout")?;
+        let mut lines = BufReader::new(stdout).lines();
+        loop {
+            match lines.next_line().await {
+                Ok(Some(line)) => {
+                    if let (Some(tx), Some(seg)) = (&live, parse_verbose_segment(&line)) {
+                        let _ = tx.send(LiveEvent::Segment(seg));
                     }
                 }
-            } else {
-                pcm_data = f32_samples;
+                Ok(None) => break,
+                Err(e) => {
+                    let _ = child.kill().await;
+                    stderr_task.abort();
+                    let _ = fs::remove_dir_all(&out_dir);
+                    return Err(e).context("Reading Faster-Whisper output");
+                }
             }
         }
 
+        let status = child.wait().await.context("Waiting for Faster-Whisper")?;
+        let stderr_text = stderr_task.await.unwrap_or_default();
+        if !status.success() {
+            let _ = fs::remove_dir_all(&out_dir);
+            anyhow::bail!(
+                "Faster-Whisper exited with {}: {}",
+                status,
+                stderr_text.trim()
+            );
+        }
+
+        // The CLI writes `<input stem>.json` into the output directory.
+        let stem = audio_path
+            .file_stem()
+            .context("Audio path has no file name")?;
+        let json_path = out_dir.join(format!("{}.json", stem.to_string_lossy()));
+        let json_str = fs::read_to_string(&json_path);
+        let _ = fs::remove_dir_all(&out_dir);
+        let json_str = json_str.context("Reading Faster-Whisper JSON output")?;
+
+        let (segments, language) = parse_whisper_json(&json_str)?;
+        if let Some(lang) = &language {
+            info!("[SOVEREIGN] Detected language: {}", lang);
+        }
+        Ok((segments, language))
+    }
+
+    /// Return the process-wide Whisper model for this path, loading it on first use.
+    ///
+    /// Deserializing the GGML weights takes seconds (tens of seconds for
+    /// large-v3), so every engine in the process shares one loaded copy.
+    /// `skip_warm_up` is checked once the weights are in; when it returns true
+    /// the GPU warm-up is left to the first real decode.
+    fn load_model(
+        model_path: &Path,
+        use_gpu: bool,
+        skip_warm_up: impl Fn() -> bool,
+    ) -> Result<Arc<LoadedWhisper>> {
+        let slot = WHISPER_MODELS
+            .get_or_init(Default::default)
+            .lock()
+            .unwrap_or_else(|e| e.into_inner())
+            .entry((model_path.to_path_buf(), use_gpu))
+            .or_default()
+            .clone();
+        let mut slot = slot.lock().unwrap_or_else(|e| e.into_inner());
+
+        if let Some(model) = slot.as_ref() {
+            info!("[SOVEREIGN] Reusing loaded Whisper model: {:?}", model_path);
+            return Ok(model.clone());
+        }
+
+        info!("[SOVEREIGN] Loading Whisper model: {:?}", model_path);
+
         // Initialize Whisper with GPU parameters if requested
         let params = WhisperContextParameters {
             use_gpu,
@@ -232,21 +497,84 @@ impl TranscriptionEngine {
 
         let ctx = WhisperContext::new_with_params(model_path.to_str().unwrap(), params)
             .map_err(|e| anyhow::anyhow!("Failed to load model: {:?}", e))?;
+        let model = Arc::new(LoadedWhisper {
+            ctx,
+            idle_state: Mutex::new(None),
+            last_used: Mutex::new(Instant::now()),
+        });
 
-        let mut state = ctx.create_state().context("Create state")?;
+        if use_gpu && !skip_warm_up() {
+            model.warm_up();
+        }
+
+        *slot = Some(model.clone());
+        spawn_idle_reaper();
+        Ok(model)
+    }
+
+    fn transcribe_blocking(
+        model_path: &Path,
+        audio_path: &Path,
+        use_gpu: bool,
+        live: Option<UnboundedSender<LiveEvent>>,
+    ) -> Result<Vec<TranscriptSegment>> {
+        // Reject input without a decodable audio stream before paying for a
+        // model load; the probe only reads container headers.
+        probe_audio(audio_path)?;
+
+        // Decode the audio on a second thread while this one loads the model,
+        // so the host-side prep overlaps the weight upload and GPU warm-up
+        // instead of running in front of them. If the decode still fails part
+        // way through, the warm-up is skipped so the error surfaces as soon as
+        // the weights are in.
+        let prep_failed = std::sync::atomic::AtomicBool::new(false);
+        let (prepared, model) = std::thread::scope(|scope| {
+            let prep = scope.spawn(|| {
+                let prepared = prepare_audio(audio_path);
+                if prepared.is_err() {
+                    prep_failed.store(true, std::sync::atomic::Ordering::Relaxed);
+                }
+                prepared
+            });
+            let model = Self::load_model(model_path, use_gpu, || {
+                prep_failed.load(std::sync::atomic::Ordering::Relaxed)
+            });
+            let prepared = prep
+                .join()
+                .unwrap_or_else(|_| Err(anyhow::anyhow!("Audio preparation panicked")));
+            (prepared, model)
+        });
+        // The input error wins over any model error.
+        let (pcm_data, speech_spans) = prepared?;
+        let model = model?;
+        let mut state = model.checkout_state()?;
 
         let mut params = FullParams::new(SamplingStrategy::Greedy { best_of: 1 });
         params.set_print_special(false);
         params.set_no_context(true);
-        params.set_print_progress(true);
-        params.set_print_realtime(true);
-        params.set_print_timestamps(true);
+        // Single greedy pass at T=0: the temperature-fallback sweep can re-decode
+        // a segment up to 5× and our hallucination filter already cleans up loops.
+        params.set_temperature(0.0);
+        params.set_temperature_inc(0.0);
+        // whisper.cpp's built-in printing runs synchronously inside the decode
+        // loop; live captions go through the segment callback instead.
+        params.set_print_progress(false);
+        params.set_print_realtime(false);
+        params.set_print_timestamps(false);
         params.set_token_timestamps(true); // enables word-level t0/t1 on each token
+        if let Some(tx) = live {
+            let spans = speech_spans.clone().unwrap_or_default();
+            params.set_segment_callback_safe(move |data: SegmentCallbackData| {
+                let _ = tx.send(LiveEvent::Segment(TranscriptSegment {
+                    start: remap_time(&spans, data.start_timestamp as f64 / 100.0, false),
+                    end: remap_time(&spans, data.end_timestamp as f64 / 100.0, true),
+                    text: data.text,
+                    words: Vec::new(),
+                }));
+            });
+        }
 
-        let num_threads = std::thread::available_parallelism()
-            .map(|n| n.get())
-            .unwrap_or(4) as i32;
-        params.set_n_threads(num_threads);
+        params.set_n_threads(matmul_threads() as i32);
 
         // Run
         state.full(params, &pcm_data).context("Running inference")?;
@@ -306,10 +634,662 @@ impl TranscriptionEngine {
             });
         }
 
+        model.checkin_state(state);
+
+        if let Some(spans) = &speech_spans {
+            for seg in &mut segments {
+                seg.start = remap_time(spans, seg.start, false);
+                seg.end = remap_time(spans, seg.end, true);
+                for word in &mut seg.words {
+                    word.start = remap_time(spans, word.start, false);
+                    word.end = remap_time(spans, word.end, true);
+                }
+            }
+        }
         Ok(filter_hallucinations(segments))
     }
 }
 
+/// Root of SYNOID's on-disk cache (`SYNOID_CACHE_DIR` or the platform cache dir).
+fn cache_root() -> PathBuf {
+    // Use environment variable for cache dir if available
+    if let Ok(cache_env) = std::env::var("SYNOID_CACHE_DIR") {
+        PathBuf::from(cache_env)
+    } else {
+        dirs::cache_dir()
+            .unwrap_or_else(|| PathBuf::from("."))
+            .join("synoid")
+    }
+}
+
+/// Load audio and splice out long silences before decoding.
+///
+/// Returns the samples to decode plus the spans needed to map timestamps back
+/// onto the original audio (`None` when nothing was trimmed).
+fn prepare_audio(audio_path: &Path) -> Result<(Vec<f32>, Option<Vec<SpeechSpan>>)> {
+    let pcm_full = load_audio(audio_path)?;
+    Ok(match trim_silence(&pcm_full) {
+        Some((trimmed, spans)) => {
+            let removed = pcm_full.len() - trimmed.len();
+            info!(
+                "[SOVEREIGN] 🔇 VAD skipped {:.1}s of silence ({:.0}% of audio)",
+                removed as f64 / 16000.0,
+                removed as f64 * 100.0 / pcm_full.len() as f64
+            );
+            (trimmed, Some(spans))
+        }
+        None => (pcm_full, None),
+    })
+}
+
+/// Check that `audio_path` has an audio stream we can decode, reading only
+/// headers: a WAV header via hound, anything else via ffprobe.
+///
+/// If ffprobe itself is unavailable the check is skipped and the full decode
+/// reports the problem instead.
+fn probe_audio(audio_path: &Path) -> Result<()> {
+    use crate::agent::tools::production_tools::safe_arg_path;
+
+    if hound::WavReader::open(audio_path).is_ok() {
+        return Ok(());
+    }
+    let output = match std::process::Command::new("ffprobe")
+        .stealth()
+        .args([
+            "-v",
+            "error",
+            "-select_streams",
+            "a:0",
+            "-show_entries",
+            "stream=codec_type",
+            "-of",
+            "csv=p=0",
+        ])
+        .arg(safe_arg_path(audio_path))
+        .output()
+    {
+        Ok(output) => output,
+        Err(e) => {
+            warn!(
+                "[SOVEREIGN] ffprobe unavailable, skipping audio probe: {}",
+                e
+            );
+            return Ok(());
+        }
+    };
+    if !output.status.success() || !String::from_utf8_lossy(&output.stdout).contains("audio") {
+        anyhow::bail!(
+            "No decodable audio stream in {:?}: {}",
+            audio_path,
+            String::from_utf8_lossy(&output.stderr).trim()
+        );
+    }
+    Ok(())
+}
+
+/// Load audio as 16kHz mono f32 samples.
+///
+/// 16kHz mono 16-bit WAV files are read directly. Anything else (video
+/// containers, mp3, other WAV rates/layouts, ...) is decoded through FFmpeg,
+/// whose resampler filters properly instead of aliasing; see `load_audio_cached`.
+fn load_audio(audio_path: &Path) -> Result<Vec<f32>> {
+    match hound::WavReader::open(audio_path) {
+        Ok(reader)
+            if reader.spec().sample_format == hound::SampleFormat::Int
+                && reader.spec().bits_per_sample == 16
+                && reader.spec().sample_rate == 16000
+                && reader.spec().channels == 1 =>
+        {
+            Ok(read_wav_16k_mono(reader))
+        }
+        _ => load_audio_cached(audio_path),
+    }
+}
+
+/// Decode media to raw 16kHz mono f32le once via an FFmpeg pipe and cache the
+/// samples under `<cache>/audio/<hash>.f32`.
+///
+/// The key covers path, size and mtime, so re-transcribing the same media
+/// (other model, retry after a failure) skips demuxing and resampling. The
+/// cache is size-bounded, see `audio_cache_limit`.
+fn load_audio_cached(audio_path: &Path) -> Result<Vec<f32>> {
+    use crate::agent::tools::production_tools::safe_arg_path;
+    use sha2::{Digest, Sha256};
+
+    let meta = fs::metadata(audio_path).with_context(|| format!("Open {:?}", audio_path))?;
+    let mtime = meta
+        .modified()
+        .ok()
+        .and_then(|t| t.duration_since(std::time::UNIX_EPOCH).ok())
+        .map(|d| d.as_nanos())
+        .unwrap_or(0);
+    let canonical = fs::canonicalize(audio_path).unwrap_or_else(|_| audio_path.to_path_buf());
+
+    let mut hasher = Sha256::new();
+    hasher.update(canonical.to_string_lossy().as_bytes());
+    hasher.update(meta.len().to_le_bytes());
+    hasher.update(mtime.to_le_bytes());
+    let key = format!("{:x}", hasher.finalize());
+
+    let cache_dir = cache_root().join("audio");
+    let cache_path = cache_dir.join(format!("{}.f32", &key[..16]));
+
+    let cache_limit = audio_cache_limit();
+
+    if cache_limit > 0 && cache_path.exists() {
+        info!("[SOVEREIGN] 🎧 Reusing decoded audio: {:?}", cache_path);
+        let file = fs::File::open(&cache_path).context("Reading decoded audio cache")?;
+        let capacity = file.metadata().map(|m| m.len() as usize / 4).unwrap_or(0);
+        return read_f32le(file, capacity, None).context("Reading decoded audio cache");
+    }
+
+    info!(
+        "[SOVEREIGN] 🎧 Decoding audio via FFmpeg (16kHz mono f32): {:?}",
+        audio_path
+    );
+    let mut child = std::process::Command::new("ffmpeg")
+        .stealth()
+        .args(["-nostdin", "-loglevel", "error", "-i"])
+        .arg(safe_arg_path(audio_path))
+        .args(["-vn", "-f", "f32le", "-ac", "1", "-ar", "16000", "-"])
+        .stdout(std::process::Stdio::piped())
+        .stderr(std::process::Stdio::piped())
+        .spawn()
+        .context("Launching FFmpeg audio decode")?;
+
+    // Drain stderr on its own thread so a chatty FFmpeg can't block on a full pipe.
+    let mut stderr = child.stderr.take().context("FFmpeg stderr not captured")?;
+    let stderr_reader = std::thread::spawn(move || {
+        let mut buf = String::new();
+        let _ = std::io::Read::read_to_string(&mut stderr, &mut buf);
+        buf
+    });
+
+    // Samples go straight from the pipe into the output Vec (and the cache
+    // file) instead of first collecting the whole stream as bytes.
+    let part_path = cache_path.with_extension("f32.part");
+    let mut part = (cache_limit > 0 && fs::create_dir_all(&cache_dir).is_ok())
+        .then(|| fs::File::create(&part_path).ok())
+        .flatten()
+        .map(std::io::BufWriter::new);
+    let stdout = child.stdout.take().context("FFmpeg stdout not captured")?;
+    let samples = read_f32le(
+        stdout,
+        0,
+        part.as_mut().map(|w| w as &mut dyn std::io::Write),
+    );
+    let status = child.wait().context("Waiting for FFmpeg audio decode")?;
+    let stderr = stderr_reader.join().unwrap_or_default();
+
+    let samples = match (samples, status.success()) {
+        (Ok(samples), true) => samples,
+        (Err(e), true) => {
+            let _ = fs::remove_file(&part_path);
+            return Err(e).context("Reading FFmpeg audio stream");
+        }
+        (_, false) => {
+            let _ = fs::remove_file(&part_path);
+            anyhow::bail!("FFmpeg audio decode failed: {}", stderr.trim());
+        }
+    };
+
+    // Write-then-rename so an interrupted run never leaves a truncated cache entry.
+    // If teeing stopped partway the file is short; only a complete copy is kept.
+    let complete = part
+        .map(|mut w| std::io::Write::flush(&mut w).is_ok())
+        .unwrap_or(false)
+        && fs::metadata(&part_path).map(|m| m.len()).ok() == Some(samples.len() as u64 * 4);
+    if complete {
+        if fs::rename(&part_path, &cache_path).is_ok() {
+            prune_audio_cache(&cache_dir, cache_limit);
+        }
+    } else {
+        let _ = fs::remove_file(&part_path);
+    }
+
+    Ok(samples)
+}
+
+/// Size cap for `<cache>/audio` in bytes (`SYNOID_AUDIO_CACHE_MB`, default
+/// 2048 MB, roughly 9 hours of 16kHz audio; 0 disables the cache).
+fn audio_cache_limit() -> u64 {
+    std::env::var("SYNOID_AUDIO_CACHE_MB")
+        .ok()
+        .and_then(|v| v.trim().parse::<u64>().ok())
+        .unwrap_or(2048)
+        .saturating_mul(1024 * 1024)
+}
+
+/// Delete the oldest cached decodes in `dir` until the `.f32` files fit in `limit` bytes.
+fn prune_audio_cache(dir: &Path, limit: u64) {
+    let Ok(entries) = fs::read_dir(dir) else {
+        return;
+    };
+    let mut files: Vec<(std::time::SystemTime, u64, PathBuf)> = entries
+        .filter_map(|entry| entry.ok())
+        .filter(|entry| entry.path().extension().is_some_and(|ext| ext == "f32"))
+        .filter_map(|entry| {
+            let meta = entry.metadata().ok()?;
+            Some((meta.modified().ok()?, meta.len(), entry.path()))
+        })
+        .collect();
+    files.sort();
+
+    let mut total: u64 = files.iter().map(|(_, len, _)| len).sum();
+    for (_, len, path) in files {
+        if total <= limit {
+            break;
+        }
+        if fs::remove_file(&path).is_ok() {
+            info!("[SOVEREIGN] 🧹 Evicted decoded audio: {:?}", path);
+            total -= len;
+        }
+    }
+}
+
+/// Read a little-endian f32 stream into a sample Vec through one fixed scratch
+/// buffer, optionally teeing the raw bytes into `sink`. A sample split across
+/// two reads is carried over rather than dropped.
+fn read_f32le(
+    mut reader: impl std::io::Read,
+    capacity: usize,
+    mut sink: Option<&mut dyn std::io::Write>,
+) -> std::io::Result<Vec<f32>> {
+    let mut samples = Vec::with_capacity(capacity);
+    let mut scratch = [0u8; 64 * 1024];
+    let mut carry = 0usize;
+
+    loop {
+        let n = match reader.read(&mut scratch[carry..]) {
+            Ok(0) => break,
+            Ok(n) => n,
+            Err(e) if e.kind() == std::io::ErrorKind::Interrupted => continue,
+            Err(e) => return Err(e),
+        };
+        if let Some(w) = sink.as_mut() {
+            // A failed cache write shouldn't fail the decode; just stop teeing.
+            if w.write_all(&scratch[carry..carry + n]).is_err() {
+                sink = None;
+            }
+        }
+
+        let filled = carry + n;
+        let whole = filled - filled % 4;
+        samples.extend(
+            scratch[..whole]
+                .chunks_exact(4)
+                .map(|b| f32::from_le_bytes([b[0], b[1], b[2], b[3]])),
+        );
+        carry = filled - whole;
+        scratch.copy_within(whole..filled, 0);
+    }
+
+    Ok(samples)
+}
+
+/// Read a 16kHz mono 16-bit WAV straight into f32 samples.
+fn read_wav_16k_mono(mut reader: hound::WavReader<std::io::BufReader<fs::File>>) -> Vec<f32> {
+    info!("[SOVEREIGN] 🎧 Native 16kHz mono detected. Fast-path memory loading...");
+    // Pre-allocate for exactly the number of samples
+    let mut pcm_data = Vec::with_capacity(reader.duration() as usize);
+
+    // Read directly into f32 vec
+    for sample in reader.samples::<i16>() {
+        if let Ok(s) = sample {
+            pcm_data.push((s as f32) / 32768.0);
+        }
+    }
+
+    pcm_data
+}
+
+/// Silences at least this long are skipped before decoding.
+const VAD_MIN_SILENCE_MS: usize = 500;
+/// Audio kept on each side of a skipped silence so word onsets aren't clipped.
+const VAD_SPEECH_PAD_MS: usize = 200;
+/// Energy floor (~-54 dBFS) below which a frame always counts as silence.
+const VAD_MIN_RMS: f32 = 0.002;
+
+/// A run of audio kept by `trim_silence`: `len` samples copied from
+/// `src_start` in the original audio to `dst_start` in the trimmed buffer.
+#[derive(Debug, Clone, Copy, PartialEq)]
+struct SpeechSpan {
+    src_start: usize,
+    dst_start: usize,
+    len: usize,
+}
+
+/// Energy-based VAD over 16kHz samples: splice out silences longer than
+/// `VAD_MIN_SILENCE_MS` so Whisper doesn't spend 30 s windows on nothing.
+///
+/// Returns the trimmed audio plus the offset table for `remap_time`, or
+/// `None` when there is nothing worth cutting (or no clear speech at all).
+fn trim_silence(pcm: &[f32]) -> Option<(Vec<f32>, Vec<SpeechSpan>)> {
+    const FRAME: usize = 480; // 30 ms at 16kHz
+    const SAMPLES_PER_MS: usize = 16;
+
+    let rms: Vec<f32> = pcm
+        .chunks_exact(FRAME)
+        .map(|f| (f.iter().map(|s| s * s).sum::<f32>() / FRAME as f32).sqrt())
+        .collect();
+    if rms.is_empty() {
+        return None;
+    }
+
+    // Adaptive threshold: a bit above the noise floor (10th percentile frame energy)
+    let mut sorted = rms.clone();
+    sorted.sort_by(|a, b| a.total_cmp(b));
+    let threshold = (sorted[sorted.len() / 10] * 2.0).max(VAD_MIN_RMS);
+    if !rms.iter().any(|&r| r > threshold) {
+        return None;
+    }
+
+    let min_silence_frames = (VAD_MIN_SILENCE_MS * SAMPLES_PER_MS / FRAME).max(1);
+    let pad = VAD_SPEECH_PAD_MS * SAMPLES_PER_MS;
+
+    // Sample ranges to cut: long silent runs, shrunk by the speech pad on each side.
+    // The trailing sentinel closes a silent run that reaches the end of the audio.
+    let mut cuts: Vec<(usize, usize)> = Vec::new();
+    let mut run_start = None;
+    for (i, &r) in rms
+        .iter()
+        .chain(std::iter::once(&f32::INFINITY))
+        .enumerate()
+    {
+        if r <= threshold {
+            run_start.get_or_insert(i);
+        } else if let Some(start) = run_start.take() {
+            let cut_start = start * FRAME + pad;
+            let cut_end = (i * FRAME).saturating_sub(pad);
+            if i - start >= min_silence_frames && cut_end > cut_start {
+                cuts.push((cut_start, cut_end));
+            }
+        }
+    }
+    if cuts.is_empty() {
+        return None;
+    }
+
+    let removed: usize = cuts.iter().map(|(s, e)| e - s).sum();
+    let mut trimmed = Vec::with_capacity(pcm.len() - removed);
+    let mut spans = Vec::with_capacity(cuts.len() + 1);
+    let mut src = 0;
+    for (cut_start, cut_end) in cuts
+        .into_iter()
+        .chain(std::iter::once((pcm.len(), pcm.len())))
+    {
+        if cut_start > src {
+            spans.push(SpeechSpan {
+                src_start: src,
+                dst_start: trimmed.len(),
+                len: cut_start - src,
+            });
+            trimmed.extend_from_slice(&pcm[src..cut_start]);
+        }
+        src = cut_end;
+    }
+
+    Some((trimmed, spans))
+}
+
+/// Map a timestamp (seconds) in VAD-trimmed audio back to the original timeline.
+///
+/// An end (`is_end`) that lands exactly on a splice point belongs to the span
+/// before it; mapping it into the next span would stretch it over the cut silence.
+fn remap_time(spans: &[SpeechSpan], t: f64, is_end: bool) -> f64 {
+    let mut sample = (t.max(0.0) * 16000.0) as usize;
+    if is_end {
+        sample = sample.saturating_sub(1);
+    }
+    let idx = spans
+        .partition_point(|span| span.dst_start <= sample)
+        .saturating_sub(1);
+    match spans.get(idx) {
+        Some(span) => t + (span.src_start - span.dst_start) as f64 / 16000.0,
+        None => t,
+    }
+}
+
+/// CUDA allocator settings for the Faster-Whisper child process.
+///
+/// CTranslate2's cub caching allocator only caches blocks up to
+/// `bin_growth^max_bin` bytes (16 MiB by default), so batched encoder
+/// activations fell through to cudaMalloc on every call; raise it to 256 MiB
+/// with a 1 GiB cache. The PyTorch setting covers CLIs whose VAD/alignment
+/// steps run on torch: one growable segment instead of fragmenting.
+const CUDA_ALLOCATOR_ENV: [(&str, &str); 2] = [
+    ("CT2_CUDA_CACHING_ALLOCATOR_CONFIG", "4,3,14,1073741824"),
+    (
+        "PYTORCH_CUDA_ALLOC_CONF",
+        "expandable_segments:True,max_split_size_mb:128,garbage_collection_threshold:0.8",
+    ),
+];
+
+/// Faster-Whisper CLI configured via the `WHISPER_BIN` env var, resolved once per process.
+///
+/// A missing binary is reported once and then skipped, instead of failing a
+/// spawn (and logging a fallback) on every transcription.
+fn faster_whisper_bin() -> Option<&'static Path> {
+    static BIN: OnceLock<Option<PathBuf>> = OnceLock::new();
+    BIN.get_or_init(|| {
+        let bin = std::env::var("WHISPER_BIN").ok()?;
+        let bin = bin.trim();
+        if bin.is_empty() {
+            return None;
+        }
+        let resolved = resolve_executable(Path::new(bin));
+        match &resolved {
+            Some(path) => info!("[SOVEREIGN] ⚡ Faster-Whisper CLI: {:?}", path),
+            None => warn!(
+                "[SOVEREIGN] WHISPER_BIN={} not found; using local Sovereign Ear only.",
+                bin
+            ),
+        }
+        resolved
+    })
+    .as_deref()
+}
+
+/// Longest a CTranslate2 conversion may run, including the download of the
+/// original checkpoint, before it is killed.
+const CT2_CONVERT_TIMEOUT: Duration = Duration::from_secs(30 * 60);
+
+/// How long a failed conversion is not retried, across restarts.
+const CT2_RETRY_AFTER: Duration = Duration::from_secs(24 * 60 * 60);
+
+/// Directory holding `model_name` converted to CTranslate2 at `compute_type`,
+/// if a converted copy is cached.
+///
+/// On a miss this returns `None` (the CLI then resolves the model itself) and,
+/// if `ct2-transformers-converter` is installed, starts the conversion in the
+/// background so later jobs can use it. No job ever waits on a conversion.
+fn ct2_model_dir(model_name: &str, compute_type: &str) -> Option<PathBuf> {
+    static CONVERTER: OnceLock<Option<PathBuf>> = OnceLock::new();
+    // Conversions this process has already started, finished or given up on.
+    static STARTED: OnceLock<Mutex<std::collections::HashSet<String>>> = OnceLock::new();
+
+    let name = format!("{}-{}", model_name, compute_type);
+    let dir = cache_root().join("ct2").join(&name);
+    if dir.join("model.bin").is_file() {
+        return Some(dir);
+    }
+
+    let converter = CONVERTER
+        .get_or_init(|| resolve_executable(Path::new("ct2-transformers-converter")))
+        .clone()?;
+    let first = STARTED
+        .get_or_init(Default::default)
+        .lock()
+        .unwrap_or_else(|e| e.into_inner())
+        .insert(name.clone());
+    if first {
+        tokio::spawn(convert_ct2_model(
+            converter,
+            format!("openai/whisper-{}", model_name),
+            compute_type.to_string(),
+            name,
+            dir,
+        ));
+    }
+    None
+}
+
+/// Convert `checkpoint` into `dir` at `compute_type`, one conversion at a time.
+///
+/// A failure leaves a `<name>.failed` note next to `dir` so other processes
+/// skip the conversion for `CT2_RETRY_AFTER` instead of re-running one that
+/// cannot succeed (e.g. the converter installed without `transformers`).
+async fn convert_ct2_model(
+    converter: PathBuf,
+    checkpoint: String,
+    compute_type: String,
+    name: String,
+    dir: PathBuf,
+) {
+    static CONVERT: tokio::sync::Mutex<()> = tokio::sync::Mutex::const_new(());
+
+    let failed_note = dir.with_file_name(format!("{}.failed", name));
+    let recently_failed = fs::metadata(&failed_note)
+        .and_then(|m| m.modified())
+        .ok()
+        .and_then(|t| t.elapsed().ok())
+        .map_or(false, |age| age < CT2_RETRY_AFTER);
+    if recently_failed {
+        return;
+    }
+
+    let _guard = CONVERT.lock().await;
+    if dir.join("model.bin").is_file() {
+        return;
+    }
+
+    info!(
+        "[SOVEREIGN] 🔧 Converting {} to CTranslate2 ({}) in the background...",
+        checkpoint, compute_type
+    );
+    // Convert into a scratch dir and rename, so a killed run never leaves a
+    // half-written model that later runs would pick up.
+    let part = dir.with_file_name(format!("{}.part", name));
+    let _ = fs::remove_dir_all(&part);
+    if let Some(parent) = dir.parent() {
+        let _ = fs::create_dir_all(parent);
+    }
+    let output = tokio::time::timeout(
+        CT2_CONVERT_TIMEOUT,
+        tokio::process::Command::new(&converter)
+            .stealth()
+            .kill_on_drop(true)
+            .arg("--model")
+            .arg(&checkpoint)
+            .arg("--output_dir")
+            .arg(&part)
+            .args(["--quantization", compute_type.as_str()])
+            .args(["--copy_files", "tokenizer.json", "preprocessor_config.json"])
+            .output(),
+    )
+    .await;
+
+    let error = match output {
+        Ok(Ok(out)) if out.status.success() => {
+            let renamed = fs::rename(&part, &dir).is_ok();
+            let _ = fs::remove_dir_all(&part);
+            // The rename also fails when another process finished the same
+            // conversion first; its copy is just as good.
+            if renamed || dir.join("model.bin").is_file() {
+                let _ = fs::remove_file(&failed_note);
+                info!("[SOVEREIGN] CTranslate2 model cached: {:?}", dir);
+                return;
+            }
+            format!("could not move converted model into {:?}", dir)
+        }
+        Ok(Ok(out)) => String::from_utf8_lossy(&out.stderr).trim().to_string(),
+        Ok(Err(e)) => format!("could not run {:?}: {}", converter, e),
+        Err(_) => format!("timed out after {}s", CT2_CONVERT_TIMEOUT.as_secs()),
+    };
+    let _ = fs::remove_dir_all(&part);
+    warn!("[SOVEREIGN] ⚠️ CTranslate2 conversion failed: {}", error);
+    let _ = fs::write(&failed_note, error);
+}
+
+/// Resolve an executable name or path without spawning it.
+fn resolve_executable(bin: &Path) -> Option<PathBuf> {
+    if bin.components().count() > 1 {
+        return bin.is_file().then(|| bin.to_path_buf());
+    }
+    let path_env = std::env::var_os("PATH")?;
+    std::env::split_paths(&path_env)
+        .flat_map(|dir| {
+            let candidate = dir.join(bin);
+            // Windows installs console scripts as `<name>.exe`
+            [candidate.with_extension("exe"), candidate]
+        })
+        .find(|candidate| candidate.is_file())
+}
+
+/// CPU threads for the encoder/decoder matmuls: one per physical core.
+///
+/// The GEMMs are bandwidth-bound and SMT siblings share the same FMA units,
+/// so hyperthreads only add contention. (CTranslate2 defaults to 4 threads.)
+/// Capped by `available_parallelism`, which honours CPU affinity masks and
+/// cgroup quotas that the physical-core count knows nothing about.
+fn matmul_threads() -> usize {
+    let allowed = std::thread::available_parallelism().map_or(usize::MAX, |n| n.get());
+    num_cpus::get_physical().min(allowed).max(1)
+}
+
+/// Pick the CTranslate2 compute type for the current device.
+///
+/// `int8_float16` needs Tensor Cores (compute capability >= 7.0); older
+/// Pascal/Maxwell cards reject it at load time, so they get `float16`
+/// (Pascal) or plain `int8`. CPU always runs `int8`.
+fn ctranslate2_compute_type(use_gpu: bool, compute_cap: Option<(u32, u32)>) -> &'static str {
+    match compute_cap {
+        Some((major, _)) if use_gpu && major >= 7 => "int8_float16",
+        Some((6, _)) if use_gpu => "float16",
+        _ => "int8",
+    }
+}
+
+/// Parse a Faster-Whisper verbose line (`[00:01.240 --> 00:04.000] text`) into a segment.
+fn parse_verbose_segment(line: &str) -> Option<TranscriptSegment> {
+    let (times, text) = line.trim().strip_prefix('[')?.split_once(']')?;
+    let (start, end) = times.split_once(" --> ")?;
+
+    // Timestamps are `MM:SS.mmm`, or `HH:MM:SS.mmm` past the first hour.
+    let parse_ts = |ts: &str| -> Option<f64> {
+        ts.trim().split(':').try_fold(0.0, |acc, part| {
+            Some(acc * 60.0 + part.parse::<f64>().ok()?)
+        })
+    };
+
+    Some(TranscriptSegment {
+        start: parse_ts(start)?,
+        end: parse_ts(end)?,
+        text: text.trim().to_string(),
+        words: Vec::new(),
+    })
+}
+
+/// Whisper-style JSON output (`{"language": .., "segments": [{start, end, text, words}]}`).
+/// Extra per-segment fields (tokens, avg_logprob, ...) are ignored.
+#[derive(Deserialize)]
+struct WhisperJson {
+    #[serde(default)]
+    language: Option<String>,
+    #[serde(default)]
+    segments: Vec<TranscriptSegment>,
+}
+
+/// Parse Whisper-style JSON into transcript segments plus the detected language.
+///
+/// Deserializes straight into typed segments in one pass instead of building
+/// an intermediate `serde_json::Value` tree, which matters for multi-hour
+/// transcripts with thousands of word timestamps.
+fn parse_whisper_json(json_str: &str) -> Result<(Vec<TranscriptSegment>, Option<String>)> {
+    let parsed: WhisperJson = serde_json::from_str(json_str).context("Parsing Whisper JSON")?;
+    Ok((parsed.segments, parsed.language))
+}
+
 /// Detect and strip Whisper hallucination loops.
 ///
 /// Whisper sometimes gets stuck repeating the same phrase for the rest of a
@@ -615,3 +1595,132 @@ fn uuid_simple() -> String {
         .subsec_nanos();
     format!("{:x}", t)
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_prune_audio_cache_drops_oldest_first() {
+        let dir = std::env::temp_dir().join(format!("synoid_audio_cache_{}", uuid_simple()));
+        fs::create_dir_all(&dir).unwrap();
+        let now = std::time::SystemTime::now();
+        for (age, name) in [(30, "old.f32"), (20, "mid.f32"), (10, "new.f32")] {
+            let file = fs::File::create(dir.join(name)).unwrap();
+            file.set_len(400).unwrap();
+            file.set_modified(now - Duration::from_secs(age)).unwrap();
+        }
+        fs::write(dir.join("other.f32.part"), [0u8; 400]).unwrap();
+
+        prune_audio_cache(&dir, 800);
+        assert!(!dir.join("old.f32").exists());
+        assert!(dir.join("mid.f32").exists());
+        assert!(dir.join("new.f32").exists());
+        // In-flight `.part` files are never touched.
+        assert!(dir.join("other.f32.part").exists());
+
+        let _ = fs::remove_dir_all(&dir);
+    }
+
+    #[test]
+    fn test_read_f32le_carries_split_samples() {
+        // Hands out 3 bytes per read so every sample straddles a read boundary.
+        struct Trickle<'a>(&'a [u8]);
+        impl std::io::Read for Trickle<'_> {
+            fn read(&mut self, buf: &mut [u8]) -> std::io::Result<usize> {
+                let n = self.0.len().min(buf.len()).min(3);
+                buf[..n].copy_from_slice(&self.0[..n]);
+                self.0 = &self.0[n..];
+                Ok(n)
+            }
+        }
+
+        let expected = [0.0f32, 1.5, -0.25, 42.0];
+        let bytes: Vec<u8> = expected.iter().flat_map(|v| v.to_le_bytes()).collect();
+        let mut tee = Vec::new();
+        let samples = read_f32le(Trickle(&bytes), 0, Some(&mut tee)).unwrap();
+        assert_eq!(samples, expected);
+        assert_eq!(tee, bytes);
+    }
+
+    #[test]
+    fn test_ctranslate2_compute_type() {
+        assert_eq!(ctranslate2_compute_type(true, Some((8, 9))), "int8_float16");
+        assert_eq!(ctranslate2_compute_type(true, Some((7, 0))), "int8_float16");
+        assert_eq!(ctranslate2_compute_type(true, Some((6, 1))), "float16");
+        assert_eq!(ctranslate2_compute_type(true, Some((5, 2))), "int8");
+        assert_eq!(ctranslate2_compute_type(true, None), "int8");
+        assert_eq!(ctranslate2_compute_type(false, None), "int8");
+    }
+
+    fn tone(secs: f64) -> Vec<f32> {
+        (0..(secs * 16000.0) as usize)
+            .map(|i| 0.5 * (i as f32 * 0.1).sin())
+            .collect()
+    }
+
+    #[test]
+    fn test_trim_silence_and_remap() {
+        // 1s speech, 2s silence, 1s speech
+        let mut pcm = tone(1.0);
+        pcm.extend(vec![0.0; 32000]);
+        pcm.extend(tone(1.0));
+
+        let (trimmed, spans) = trim_silence(&pcm).expect("silence should be cut");
+        assert_eq!(spans.len(), 2);
+        assert!(trimmed.len() < pcm.len());
+        assert_eq!(spans[1].dst_start, spans[0].len);
+
+        // First span is untouched; the second tone maps back to 3.0s
+        assert!((remap_time(&spans, 0.5, false) - 0.5).abs() < 1e-9);
+        let second_tone = (48000 - (pcm.len() - trimmed.len())) as f64 / 16000.0;
+        assert!((remap_time(&spans, second_tone, false) - 3.0).abs() < 1e-3);
+
+        // At the splice point a start opens the next span, but an end closes
+        // the previous one instead of jumping over the removed silence.
+        let splice = spans[1].dst_start as f64 / 16000.0;
+        assert!(remap_time(&spans, splice, false) > 2.5);
+        assert!(remap_time(&spans, splice, true) < 1.5);
+    }
+
+    #[test]
+    fn test_trim_silence_keeps_continuous_speech() {
+        assert!(trim_silence(&tone(3.0)).is_none());
+        assert!(trim_silence(&vec![0.0; 48000]).is_none());
+        assert!(trim_silence(&[]).is_none());
+    }
+
+    #[test]
+    fn test_parse_verbose_segment() {
+        let seg = parse_verbose_segment("[00:01.240 --> 00:04.000]  Hello there").unwrap();
+        assert!((seg.start - 1.24).abs() < 1e-9);
+        assert!((seg.end - 4.0).abs() < 1e-9);
+        assert_eq!(seg.text, "Hello there");
+
+        let seg = parse_verbose_segment("[01:02:03.500 --> 01:02:05.000] Later").unwrap();
+        assert!((seg.start - 3723.5).abs() < 1e-9);
+
+        assert!(parse_verbose_segment("Detected language 'en' with probability 0.99").is_none());
+    }
+
+    #[test]
+    fn test_parse_whisper_json() {
+        let json = r#"{
+            "text": " Hello world.",
+            "language": "en",
+            "segments": [
+                {"id": 0, "start": 0.0, "end": 1.5, "text": " Hello world.", "avg_logprob": -0.2,
+                 "words": [{"start": 0.0, "end": 0.6, "word": " Hello", "probability": 0.9},
+                           {"start": 0.7, "end": 1.5, "word": " world.", "probability": 0.8}]},
+                {"id": 1, "start": 2.0, "end": 3.0, "text": " Bye."}
+            ]
+        }"#;
+
+        let (segments, language) = parse_whisper_json(json).unwrap();
+        assert_eq!(language.as_deref(), Some("en"));
+        assert_eq!(segments.len(), 2);
+        assert_eq!(segments[0].words.len(), 2);
+        assert_eq!(segments[0].words[1].word, " world.");
+        assert!(segments[1].words.is_empty());
+    }
+}
@@ -382,28 +382,9 @@ async fn transcribe_asset(
         req.asset_id, session_id
     );
 
-    // Extract audio to WAV for Whisper
-    let wav_path = file_path.with_extension("_transcribe.wav");
-    let extract_ok = Command::new("ffmpeg")
-        .stealth()
-        .args(["-y", "-i"])
-        .arg(&file_path)
-        .args(["-ar", "16000", "-ac", "1", "-f", "wav"])
-        .arg(&wav_path)
-        .status()
-        .await
-        .map(|s| s.success())
-        .unwrap_or(false);
-
-    if !extract_ok {
-        return (
-            StatusCode::INTERNAL_SERVER_ERROR,
-            Json(json!({"error": "Audio extraction failed"})),
-        )
-            .into_response();
-    }
-
-    let engine = match crate::agent::transcription::TranscriptionEngine::new(None).await {
+    // The engine decodes the asset over an FFmpeg pipe (16kHz mono f32), so no
+    // intermediate WAV is written to disk first.
+    let engine = match crate::agent::transcription::TranscriptionEngine::shared().await {
         Ok(e) => e,
         Err(e) => {
             error!("[EDITOR-API] Transcription engine init failed: {}", e);
@@ -415,10 +396,9 @@ async fn transcribe_asset(
         }
     };
 
-    let segments = match engine.transcribe(&wav_path).await {
+    let segments = match engine.transcribe(&file_path).await {
         Ok(s) => s,
         Err(e) => {
-            let _ = tfs::remove_file(&wav_path).await;
             error!("[EDITOR-API] Transcription failed: {}", e);
             return (
                 StatusCode::INTERNAL_SERVER_ERROR,
@@ -427,7 +407,6 @@ async fn transcribe_asset(
                 .into_response();
         }
     };
-    let _ = tfs::remove_file(&wav_path).await;
 
     // Build word-level approximation (distribute words evenly within each segment)
     let mut words = Vec::new();
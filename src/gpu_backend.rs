@@ -136,6 +136,27 @@ impl GpuContext {
         matches!(self.backend, GpuBackend::NvencGpu { .. })
     }
 
+    /// CUDA compute capability of the primary NVIDIA GPU, e.g. `(8, 9)` for Ada.
+    ///
+    /// Queried once via nvidia-smi; `None` on CPU or when the driver is too
+    /// old to report `compute_cap`.
+    pub fn compute_capability(&self) -> Option<(u32, u32)> {
+        if !self.has_gpu() {
+            return None;
+        }
+        *COMPUTE_CAPABILITY.get_or_init(|| {
+            let output = Command::new("nvidia-smi")
+                .stealth()
+                .args(["--query-gpu=compute_cap", "--format=csv,noheader"])
+                .output()
+                .ok()?;
+            if !output.status.success() {
+                return None;
+            }
+            parse_compute_cap(&String::from_utf8_lossy(&output.stdout))
+        })
+    }
+
     /// Get the number of parallel workers for this backend
     pub fn parallel_workers(&self) -> usize {
         match &self.backend {
@@ -233,6 +254,16 @@ impl GpuContext {
     }
 }
 
+/// Parse nvidia-smi `compute_cap` output ("8.9") into `(major, minor)`.
+/// Multi-GPU systems report one line per device; the first one wins.
+fn parse_compute_cap(stdout: &str) -> Option<(u32, u32)> {
+    let (major, minor) = stdout.lines().next()?.trim().split_once('.')?;
+    Some((major.parse().ok()?, minor.parse().ok()?))
+}
+
+/// Cached compute capability (see `GpuContext::compute_capability`)
+static COMPUTE_CAPABILITY: std::sync::OnceLock<Option<(u32, u32)>> = std::sync::OnceLock::new();
+
 /// Global GPU context accessor
 static GPU_CONTEXT: std::sync::OnceLock<GpuContext> = std::sync::OnceLock::new();
 
@@ -319,6 +350,14 @@ mod tests {
         assert_eq!(cfg.ffmpeg_preset, "medium");
     }
 
+    #[test]
+    fn test_parse_compute_cap() {
+        assert_eq!(parse_compute_cap("8.9\n"), Some((8, 9)));
+        assert_eq!(parse_compute_cap("12.0\n7.5\n"), Some((12, 0)));
+        assert_eq!(parse_compute_cap("[N/A]"), None);
+        assert_eq!(parse_compute_cap(""), None);
+    }
+
     #[test]
     fn test_cuda_accel_config_scales_with_speed() {
         let ctx = GpuContext {
@@ -313,11 +313,21 @@ enum Commands {
         interval: u64,
     },
 
-    /// Transcribe a video and save a clean SRT subtitle file next to it
+    /// Transcribe videos and save a clean SRT subtitle file next to each
     Transcribe {
-        /// Input video path
-        #[arg(short, long)]
-        input: PathBuf,
+        /// Input video path(s); repeat or list several to batch them in one run
+        #[arg(short, long, num_args = 1.., required = true)]
+        input: Vec<PathBuf>,
+
+        /// How many inputs to transcribe concurrently. Each extra job adds a
+        /// Whisper decoding state (or, with Faster-Whisper, a separate process
+        /// with its own model copy) and competes for the same cores and VRAM.
+        #[arg(short, long, default_value_t = 1)]
+        jobs: usize,
+
+        /// 30 s windows per encoder pass for Faster-Whisper (default: 8 on CUDA, 1 on CPU)
+        #[arg(long)]
+        batch_size: Option<usize>,
     },
 }
 
@@ -344,7 +354,28 @@ fn main() -> Result<(), Box<dyn std::error::Error + Send + Sync>> {
 
 #[tokio::main]
 async fn async_main() -> Result<(), Box<dyn std::error::Error + Send + Sync>> {
-    tracing_subscriber::fmt::init();
+    let args = Cli::parse();
+
+    // `transcribe` streams NDJSON on stdout, so its logs go to stderr. The filter
+    // mirrors `fmt::init()`: RUST_LOG directives when set, INFO otherwise.
+    if matches!(args.command, Commands::Transcribe { .. }) {
+        use tracing_subscriber::filter::{LevelFilter, Targets};
+        use tracing_subscriber::layer::SubscriberExt;
+        use tracing_subscriber::util::SubscriberInitExt;
+
+        let targets = std::env::var("RUST_LOG")
+            .ok()
+            .and_then(|directives| directives.parse::<Targets>().ok())
+            .unwrap_or_else(|| Targets::new().with_default(LevelFilter::INFO));
+        tracing_subscriber::fmt()
+            .with_writer(std::io::stderr)
+            .with_max_level(LevelFilter::TRACE)
+            .finish()
+            .with(targets)
+            .init();
+    } else {
+        tracing_subscriber::fmt::init();
+    }
 
     // Global panic handler: log panics instead of crashing silently
     std::panic::set_hook(Box::new(|panic_info| {
@@ -374,8 +405,6 @@ async fn async_main() -> Result<(), Box<dyn std::error::Error + Send + Sync>> {
         );
     }
 
-    let args = Cli::parse();
-
     // Auto-set Instance ID based on port if in GUI mode and not already set
     if let Commands::Gui { port } = args.command {
         if port != 3000 && std::env::var("SYNOID_INSTANCE_ID").is_err() {
@@ -755,41 +784,110 @@ async fn async_main() -> Result<(), Box<dyn std::error::Error + Send + Sync>> {
             info!("🛑 GEPA Loop Stopped.");
         }
 
-        Commands::Transcribe { input } => {
-            use synoid_core::agent::tools::production_tools;
+        Commands::Transcribe {
+            input,
+            jobs,
+            batch_size,
+        } => {
+            use anyhow::Context;
             use synoid_core::agent::tools::transcription::{
-                TranscriptionEngine, filter_hallucinations, generate_srt,
+                filter_hallucinations, generate_srt, LiveEvent, TranscriptionEngine,
             };
 
-            info!("[TRANSCRIBE] Input: {:?}", input);
-
-            let tmp_wav = input.with_extension("_whisper_tmp.wav");
-            let audio_path = match production_tools::extract_audio_wav(&input, &tmp_wav).await {
-                Ok(p) => {
-                    info!("[TRANSCRIBE] Audio extracted to {:?}", p);
-                    p
-                }
-                Err(e) => {
-                    error!("[TRANSCRIBE] Audio extraction failed: {}. Trying direct input.", e);
-                    input.clone()
-                }
+            // One engine (and one loaded model) for the whole batch; a semaphore
+            // bounds how many inputs are decoding/transcribing at once.
+            let engine = match batch_size {
+                Some(batch_size) => Arc::new(
+                    TranscriptionEngine::new(None)
+                        .await?
+                        .with_batch_size(batch_size),
+                ),
+                None => TranscriptionEngine::shared().await?,
             };
-
-            let engine = TranscriptionEngine::new(None).await?;
-            let segments = engine.transcribe(&audio_path).await?;
-            let segments = filter_hallucinations(segments);
-
-            // Clean up temp WAV
-            if audio_path == tmp_wav {
-                let _ = std::fs::remove_file(&tmp_wav);
+            let semaphore = Arc::new(tokio::sync::Semaphore::new(jobs.max(1)));
+            let total = input.len();
+
+            let mut tasks = tokio::task::JoinSet::new();
+            for input in input {
+                let engine = engine.clone();
+                let semaphore = semaphore.clone();
+                tasks.spawn(async move {
+                    let _permit = semaphore.acquire_owned().await?;
+
+                    // The engine decodes the media itself over an FFmpeg pipe (16kHz mono f32),
+                    // so there is no intermediate WAV to write, re-read and clean up.
+                    info!("[TRANSCRIBE] Input: {:?}", input);
+
+                    // Print each segment as NDJSON the moment it is decoded (live captions).
+                    // A `reset` line means the engine fell back to another backend that
+                    // starts over, so consumers should drop this input's captions so far.
+                    let (live_tx, mut live_rx) =
+                        tokio::sync::mpsc::unbounded_channel::<LiveEvent>();
+                    let tag = input.display().to_string();
+                    let printer = tokio::spawn(async move {
+                        while let Some(event) = live_rx.recv().await {
+                            let line = match event {
+                                LiveEvent::Segment(seg) => serde_json::json!({
+                                    "input": tag,
+                                    "start": seg.start,
+                                    "end": seg.end,
+                                    "text": seg.text,
+                                }),
+                                LiveEvent::Restart => serde_json::json!({
+                                    "input": tag,
+                                    "reset": true,
+                                }),
+                            };
+                            println!("{}", line);
+                        }
+                    });
+
+                    let result = engine.transcribe_streaming(&input, Some(live_tx)).await;
+                    let _ = printer.await;
+                    let (segments, language) =
+                        result.with_context(|| format!("Transcribing {:?}", input))?;
+                    let segments = filter_hallucinations(segments);
+
+                    let srt_path = input.with_extension("srt");
+                    let srt_content = generate_srt(&segments);
+                    std::fs::write(&srt_path, &srt_content)
+                        .with_context(|| format!("Writing {:?}", srt_path))?;
+
+                    info!(
+                        "[TRANSCRIBE] ✅ {} segments → {:?}",
+                        segments.len(),
+                        srt_path
+                    );
+
+                    // Closing line per input, so line-by-line consumers know it finished.
+                    let done = serde_json::json!({
+                        "input": input.display().to_string(),
+                        "done": true,
+                        "language": language,
+                        "srt": srt_path.display().to_string(),
+                    });
+                    println!("{}", done);
+                    Ok::<_, anyhow::Error>(())
+                });
             }
 
-            let srt_path = input.with_extension("srt");
-            let srt_content = generate_srt(&segments);
-            std::fs::write(&srt_path, &srt_content)?;
-
-            info!("[TRANSCRIBE] ✅ {} segments → {:?}", segments.len(), srt_path);
-            println!("Saved: {:?}", srt_path);
+            let mut failed = 0;
+            while let Some(joined) = tasks.join_next().await {
+                match joined {
+                    Ok(Ok(())) => {}
+                    Ok(Err(e)) => {
+                        error!("[TRANSCRIBE] ❌ {:#}", e);
+                        failed += 1;
+                    }
+                    Err(e) => {
+                        error!("[TRANSCRIBE] ❌ Task failed: {}", e);
+                        failed += 1;
+                    }
+                }
+            }
+            if failed > 0 {
+                return Err(format!("{} of {} transcriptions failed", failed, total).into());
+            }
         }
     }
 
@@ -2596,7 +2596,7 @@ impl SynoidApp {
                                                 let ui_ptr = self.ui_state.clone();
                                                 tokio::spawn(async move {
                                                     tracing::info!("[GUI] Triggering transcription for {}", input_path);
-                                                    if let Ok(engine) = crate::agent::transcription::TranscriptionEngine::new(None).await {
+                                                    if let Ok(engine) = crate::agent::transcription::TranscriptionEngine::shared().await {
                                                         if let Ok(segments) = engine.transcribe(std::path::Path::new(&input_path)).await {
                                                             let srt_content = crate::agent::transcription::generate_srt(&segments);
                                                             let out_srt = std::path::Path::new(&input_path).with_extension("srt");